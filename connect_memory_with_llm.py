@@ -8,8 +8,7 @@ load_dotenv()
 print("🔧 Loading dependencies...")
 
 try:
-    from langchain_community.vectorstores import FAISS
-    from langchain_huggingface import HuggingFaceEmbeddings
+    from vector_store_manifest import load_vector_store as load_vector_store_with_manifest
     print("✅ All dependencies loaded successfully!")
 except ImportError as e:
     print(f"❌ Missing dependency: {e}")
@@ -34,13 +33,12 @@ def setup_gemini():
         return None
 
 def load_vector_store():
-    """Load FAISS vector store"""
+    """Load FAISS vector store with the query embedder recorded in its manifest"""
     DB_FAISS_PATH = "vectorstore/db_faiss"
     
     try:
-        embedding_model = HuggingFaceEmbeddings(model_name="sentence-transformers/all-MiniLM-L6-v2")
-        db = FAISS.load_local(DB_FAISS_PATH, embedding_model, allow_dangerous_deserialization=True)
-        print("✅ FAISS vector database loaded!")
+        db, manifest = load_vector_store_with_manifest(DB_FAISS_PATH)
+        print(f"✅ FAISS vector database loaded! ({manifest['backend']}: {manifest['model']}, dim {manifest['dimension']})")
         return db
     except Exception as e:
         print(f"❌ Error loading FAISS database: {e}")
@@ -1,10 +1,22 @@
 from langchain_community.document_loaders import PyPDFLoader, DirectoryLoader
 from langchain.text_splitter import RecursiveCharacterTextSplitter
-from langchain_huggingface import HuggingFaceEmbeddings
 from langchain_community.vectorstores import FAISS
 import google.generativeai as genai
 import os
 
+from vector_store_manifest import (
+    DISTANCE_STRATEGY,
+    GEMINI_BACKEND,
+    GEMINI_MODEL,
+    HUGGINGFACE_BACKEND,
+    HUGGINGFACE_MODEL,
+    build_manifest,
+    get_embedder,
+    l2_normalize,
+    load_vector_store,
+    save_vector_store,
+)
+
 ## Uncomment the following files if you're not using pipenv as your virtual environment manager
 from dotenv import load_dotenv
 load_dotenv()
@@ -52,14 +64,14 @@ print("Length of Text Chunks: ", len(text_chunks))
 def get_embedding_model():
     """Get embedding model - you can choose between HuggingFace or Gemini"""
     # Option 1: Continue using HuggingFace (recommended for now as Gemini embeddings have separate API)
-    embedding_model = HuggingFaceEmbeddings(model_name="sentence-transformers/all-MiniLM-L6-v2")
+    embedding_model = get_embedder(HUGGINGFACE_BACKEND, HUGGINGFACE_MODEL)
     return embedding_model
 
 def get_gemini_embeddings(texts):
     """Get embeddings using Gemini's embedding model"""
     try:
         # Using Gemini's embedding model
-        embedding_model = "models/embedding-001"
+        embedding_model = GEMINI_MODEL
         embeddings = []
         
         for text in texts:
@@ -77,7 +89,11 @@ def get_gemini_embeddings(texts):
 
 # Step 4: Enhanced function to store embeddings with Gemini integration
 def create_vector_store_with_gemini(text_chunks, use_gemini_embeddings=False):
-    """Create vector store with option to use Gemini embeddings"""
+    """Create vector store with option to use Gemini embeddings
+
+    Vectors are L2-normalized here so search is a plain inner product.
+    Returns the store and the manifest describing how it was embedded.
+    """
     
     if use_gemini_embeddings:
         # Extract text from documents
@@ -87,24 +103,22 @@ def create_vector_store_with_gemini(text_chunks, use_gemini_embeddings=False):
         gemini_embeddings = get_gemini_embeddings(texts)
         
         if gemini_embeddings:
-            # Create FAISS index with custom embeddings
-            from langchain_community.vectorstores.utils import DistanceStrategy
-            from langchain_community.vectorstores import FAISS
-            
-            # Create FAISS index manually with Gemini embeddings
+            # Create FAISS index manually with Gemini embeddings, querying
+            # through the same Gemini model that produced them
             db = FAISS.from_embeddings(
-                text_embeddings=list(zip(texts, gemini_embeddings)),
-                embedding=HuggingFaceEmbeddings(),  # Dummy embedding for interface
-                distance_strategy=DistanceStrategy.COSINE
+                text_embeddings=list(zip(texts, l2_normalize(gemini_embeddings))),
+                embedding=get_embedder(GEMINI_BACKEND, GEMINI_MODEL),
+                metadatas=[chunk.metadata for chunk in text_chunks],
+                distance_strategy=DISTANCE_STRATEGY
             )
-            return db
+            return db, build_manifest(db, GEMINI_BACKEND, GEMINI_MODEL)
         else:
             print("Falling back to HuggingFace embeddings due to Gemini API issues")
     
     # Default: Use HuggingFace embeddings
     embedding_model = get_embedding_model()
-    db = FAISS.from_documents(text_chunks, embedding_model)
-    return db
+    db = FAISS.from_documents(text_chunks, embedding_model, distance_strategy=DISTANCE_STRATEGY)
+    return db, build_manifest(db, HUGGINGFACE_BACKEND, HUGGINGFACE_MODEL)
 
 # Step 5: Query using Gemini
 def query_with_gemini(query, db, k=3):
@@ -145,16 +159,15 @@ def query_with_gemini(query, db, k=3):
 DB_FAISS_PATH = "vectorstore/db_faiss"
 
 # Create vector store (using HuggingFace embeddings by default)
-db = create_vector_store_with_gemini(text_chunks, use_gemini_embeddings=False)
-db.save_local(DB_FAISS_PATH)
+db, manifest = create_vector_store_with_gemini(text_chunks, use_gemini_embeddings=False)
+save_vector_store(db, manifest, DB_FAISS_PATH)
 print("Vector store created and saved successfully!")
 
 # Example usage
 def chat_with_pdf():
     """Interactive chat function using Gemini"""
     # Load the saved vector store
-    embedding_model = get_embedding_model()
-    db = FAISS.load_local(DB_FAISS_PATH, embedding_model, allow_dangerous_deserialization=True)
+    db, _ = load_vector_store(DB_FAISS_PATH)
     
     print("Chat with your PDF! Type 'exit' to quit.")
     
@@ -173,8 +186,7 @@ def chat_with_pdf():
 # Alternative: Simple query example
 def simple_query_example():
     """Example of a single query"""
-    embedding_model = get_embedding_model()
-    db = FAISS.load_local(DB_FAISS_PATH, embedding_model, allow_dangerous_deserialization=True)
+    db, _ = load_vector_store(DB_FAISS_PATH)
     
     query = "What is the main topic of the document?"
     response = query_with_gemini(query, db)
@@ -0,0 +1,154 @@
+import json
+import os
+
+import numpy as np
+import google.generativeai as genai
+from langchain_core.embeddings import Embeddings
+from langchain_community.vectorstores import FAISS
+from langchain_community.vectorstores.utils import DistanceStrategy
+from langchain_huggingface import HuggingFaceEmbeddings
+
+MANIFEST_FILE = "manifest.json"
+MANIFEST_VERSION = 1
+
+HUGGINGFACE_BACKEND = "huggingface"
+GEMINI_BACKEND = "gemini"
+HUGGINGFACE_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+GEMINI_MODEL = "models/embedding-001"
+
+# Vectors are L2-normalized once when embedded, so a flat inner-product index
+# gives cosine similarity without FAISS re-normalizing on every query.
+DISTANCE_STRATEGY = DistanceStrategy.MAX_INNER_PRODUCT
+
+
+def l2_normalize(vectors):
+    """L2-normalize a list of vectors, leaving all-zero vectors untouched"""
+    array = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(array, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (array / norms).tolist()
+
+
+class GeminiEmbeddings(Embeddings):
+    """Gemini embeddings with separate task types for documents and queries"""
+
+    def __init__(self, model=GEMINI_MODEL):
+        self.model = model
+
+    def _embed(self, text, task_type):
+        result = genai.embed_content(
+            model=self.model,
+            content=text,
+            task_type=task_type
+        )
+        return result['embedding']
+
+    def embed_documents(self, texts):
+        return [self._embed(text, "retrieval_document") for text in texts]
+
+    def embed_query(self, text):
+        return self._embed(text, "retrieval_query")
+
+
+class NormalizedEmbeddings(Embeddings):
+    """Wrap an embedding model so every vector it returns is L2-normalized"""
+
+    def __init__(self, embeddings, dimension=None):
+        self.embeddings = embeddings
+        self.dimension = dimension
+
+    def _check(self, vectors):
+        if self.dimension is not None:
+            for vector in vectors:
+                if len(vector) != self.dimension:
+                    raise ValueError(
+                        f"Embedding dimension {len(vector)} does not match "
+                        f"index dimension {self.dimension}"
+                    )
+        return l2_normalize(vectors)
+
+    def embed_documents(self, texts):
+        return self._check(self.embeddings.embed_documents(texts))
+
+    def embed_query(self, text):
+        return self._check([self.embeddings.embed_query(text)])[0]
+
+
+def get_embedder(backend, model, dimension=None):
+    """Build the normalized embedder for a backend/model pair"""
+    if backend == HUGGINGFACE_BACKEND:
+        base = HuggingFaceEmbeddings(model_name=model)
+    elif backend == GEMINI_BACKEND:
+        base = GeminiEmbeddings(model=model)
+    else:
+        raise ValueError(f"Unknown embedding backend in manifest: {backend!r}")
+    return NormalizedEmbeddings(base, dimension=dimension)
+
+
+def build_manifest(db, backend, model):
+    """Describe how the vectors in a FAISS store were produced"""
+    return {
+        "version": MANIFEST_VERSION,
+        "backend": backend,
+        "model": model,
+        "dimension": db.index.d,
+        "normalized": True,
+        "index_type": type(db.index).__name__,
+        "distance_strategy": DISTANCE_STRATEGY.value,
+    }
+
+
+def save_vector_store(db, manifest, db_path):
+    """Save a FAISS store together with its embedding manifest"""
+    db.save_local(db_path)
+    with open(os.path.join(db_path, MANIFEST_FILE), "w") as f:
+        json.dump(manifest, f, indent=2)
+
+
+def load_manifest(db_path):
+    """Read the embedding manifest saved next to a FAISS store"""
+    manifest_path = os.path.join(db_path, MANIFEST_FILE)
+    if not os.path.exists(manifest_path):
+        raise FileNotFoundError(
+            f"No {MANIFEST_FILE} in {db_path}; rebuild the index with create_memory_for_llm.py"
+        )
+    with open(manifest_path) as f:
+        manifest = json.load(f)
+
+    if manifest.get("version") != MANIFEST_VERSION:
+        raise ValueError(f"Unsupported manifest version: {manifest.get('version')!r}")
+    if not manifest.get("normalized"):
+        raise ValueError("Index vectors are not normalized; rebuild the index")
+    if manifest.get("distance_strategy") != DISTANCE_STRATEGY.value:
+        raise ValueError(
+            f"Unsupported distance strategy: {manifest.get('distance_strategy')!r}"
+        )
+    return manifest
+
+
+def load_vector_store(db_path):
+    """Load a FAISS store with the query embedder its manifest describes"""
+    manifest = load_manifest(db_path)
+    embedder = get_embedder(
+        manifest["backend"], manifest["model"], dimension=manifest["dimension"]
+    )
+    db = FAISS.load_local(
+        db_path,
+        embedder,
+        allow_dangerous_deserialization=True,
+        distance_strategy=DISTANCE_STRATEGY
+    )
+
+    index_type = type(db.index).__name__
+    if index_type != manifest["index_type"]:
+        raise ValueError(
+            f"Index type {index_type} does not match manifest {manifest['index_type']}"
+        )
+    if db.index.d != manifest["dimension"]:
+        raise ValueError(
+            f"Index dimension {db.index.d} does not match manifest {manifest['dimension']}"
+        )
+
+    # Embed once up front so a wrong query model fails here, not mid-chat
+    embedder.embed_query("dimension check")
+    return db, manifest